@@ -1,10 +1,60 @@
+import os
 import random
-from colorama import init, Fore, Back, Style
-
-# Initialize colorama
-init(autoreset=True)
+import sys
+
+# Windows 10+ consoles render ANSI once ENABLE_VIRTUAL_TERMINAL_PROCESSING is set
+def activar_ansi_windows():
+    import ctypes  # solo en Windows: importarlo en POSIX retrasa el arranque
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GetStdHandle.restype = ctypes.c_void_p  # HANDLE is pointer-sized
+    consola = ctypes.c_void_p(kernel32.GetStdHandle(-11))  # STD_OUTPUT_HANDLE
+    modo = ctypes.c_ulong()
+    if not kernel32.GetConsoleMode(consola, ctypes.byref(modo)):
+        return False
+    return bool(kernel32.SetConsoleMode(consola, modo.value | 0x0004))
+
+# Game colors as raw ANSI codes: terminals that render ANSI natively get them as
+# is, and colorama only wraps stdout on older Windows consoles; redirected output
+# or NO_COLOR (https://no-color.org) gets empty strings
+if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    AMARILLO = VERDE = AZUL = ROJO = REINICIO = ""
+else:
+    AMARILLO = "\x1b[33m"
+    VERDE = "\x1b[32m"
+    AZUL = "\x1b[34m"
+    ROJO = "\x1b[31m"
+    REINICIO = "\x1b[0m"
+    if sys.platform == "win32" and not activar_ansi_windows():
+        from colorama import init
+        init(autoreset=True)
+
+# Buffer de salida: todo el texto del juego se acumula aquí y se escribe de una
+# sola vez antes de cada lectura del teclado y al terminar
+_buffer_salida = []
+
+def emitir(texto):
+    _buffer_salida.append(texto)
+
+def volcar():
+    sys.stdout.write("".join(_buffer_salida))
+    _buffer_salida.clear()
+
+# Lee una opción de menú de un dígito; devuelve -1 si no está en `validas` (p. ej. "12")
+# y lanza EOFError si la entrada se acaba, igual que input()
+def leer_opcion(validas):
+    volcar()
+    sys.stdout.flush()
+    linea = sys.stdin.readline()
+    if not linea:
+        raise EOFError("fin de la entrada")
+    opcion = linea.strip()
+    if len(opcion) == 1 and opcion in validas:
+        return int(opcion)
+    return -1
 
 class Personaje:
+    __slots__ = ("nombre", "vidas", "ataque", "esta_defendiendo")
+
     def __init__(self, nombre, vidas, ataque):
         self.nombre = nombre
         self.vidas = vidas
@@ -13,12 +63,25 @@ class Personaje:
 
     def atacar(self, enemigo):
         enemigo.vidas -= self.ataque
-        print(Fore.GREEN + f"¡Atacas al {enemigo.nombre} con todas tus fuerzas!")
-        print(Fore.GREEN + f"Le infliges {self.ataque} de daño.")
 
     def defender(self):
         self.esta_defendiendo = True
-        print(Fore.BLUE + "Te preparas para el impacto, subiendo tu guardia.")
+
+# Reglas de un turno de combate, compartidas por main() y simular_combate():
+# 1 ataca, 2 defiende y cualquier otra opción pierde el turno. Si el monstruo
+# sigue vivo, contraataca y se devuelve el daño recibido; si cae, devuelve None
+def resolver_turno(jugador, monstruo, decision):
+    if decision == 1:
+        jugador.atacar(monstruo)
+    elif decision == 2:
+        jugador.defender()
+    if monstruo.vidas <= 0:
+        return None
+    # Defenderse (True == 1) desplaza un bit: el daño queda a la mitad
+    dano = monstruo.ataque >> jugador.esta_defendiendo
+    jugador.esta_defendiendo = False
+    jugador.vidas -= dano
+    return dano
 
 # Diccionario de monstruos
 catalogo_monstruos = {
@@ -28,88 +91,125 @@ catalogo_monstruos = {
     "Slime": {"vidas": 60, "ataque": 12}
 }
 
+# Mismos datos en tuplas paralelas: un índice al azar da nombre, vidas y ataque
+NOMBRES_MONSTRUOS = tuple(catalogo_monstruos)
+VIDAS_MONSTRUOS = tuple(stats["vidas"] for stats in catalogo_monstruos.values())
+ATAQUES_MONSTRUOS = tuple(stats["ataque"] for stats in catalogo_monstruos.values())
+
+# Combate sin interfaz para simulaciones en lote: mismas reglas que el bucle de main().
+# `decisiones` es la secuencia de opciones del jugador (1 atacar, 2 defender).
+# Devuelve 1 si gana el jugador, 0 si pierde y -1 si se acaban las decisiones.
+def simular_combate(vidas, ataque, vidas_monstruo, ataque_monstruo, decisiones):
+    jugador = Personaje("", vidas, ataque)
+    monstruo = Personaje("", vidas_monstruo, ataque_monstruo)
+    for decision in decisiones:
+        if resolver_turno(jugador, monstruo, decision) is None:
+            return 1
+        if jugador.vidas <= 0:
+            return 0
+    return -1
+
+# Textos fijos del juego, construidos una sola vez
+# Cada bloque de color lleva un solo código de color y un solo reinicio al final
+BIENVENIDA = (AMARILLO + "¡Bienvenido a las cavernas de la actividad 3!\n"
+              "Introduce el nombre de tu héroe: " + REINICIO)
+SEPARADOR = "-" * 48 + "\n"
+PLANTILLA_ESTADISTICAS = (SEPARADOR +
+                          "Hola, {nombre}. Tus estadísticas son:\n"
+                          "  Vida: {vidas}\n"
+                          "  Ataque: {ataque}\n"
+                          "  Defensa: {defensa}\n" +
+                          SEPARADOR)
+MENU_CAMINO = ("Llegas a una bifurcación en el camino.\n"
+               "Un camino lleva al bosque tranquilo, el otro a una cueva oscura.\n"
+               " \n"
+               f"{AMARILLO}1. Ir por el bosque (Ruta Segura).\n"
+               f"2. Entrar a la cueva (Ruta Peligrosa).\n{REINICIO}")
+INICIO_COMBATE = AMARILLO + "¡COMIENZA EL COMBATE!" + REINICIO + "\n"
+ENCABEZADO_TURNO = "--- NUEVO TURNO ---\n"
+MENSAJE_DEFENSA = AZUL + "Te preparas para el impacto, subiendo tu guardia." + REINICIO + "\n"
+MENU_COMBATE = (" \n" + AMARILLO + "¿Qué harás?\n"
+                "1. Atacar ({ataque} de daño)\n"
+                "2. Defenderse (reduce el próximo golpe a la mitad)\n" + REINICIO)
+
 # Función principal del juego
 def main():
-    print(Fore.YELLOW + "¡Bienvenido a las cavernas de la actividad 3!")
-    nombre_heroe = input(Fore.YELLOW + "Introduce el nombre de tu héroe: ")
+    emitir(BIENVENIDA)
+    volcar()
+    sys.stdout.flush()
+    nombre_heroe = input()
 
     # Crear instancia del jugador
     jugador = Personaje(nombre_heroe, 100, 15)
 
-    print("------------------------------------------------")
-    print(f"Hola, {jugador.nombre}. Tus estadísticas son:")
-    print(f"  Vida: {jugador.vidas}")
-    print(f"  Ataque: {jugador.ataque}")
-    print(f"  Defensa: {jugador.ataque}")
-    print("------------------------------------------------")
+    emitir(PLANTILLA_ESTADISTICAS.format(nombre=jugador.nombre, vidas=jugador.vidas,
+                                         ataque=jugador.ataque, defensa=jugador.ataque))
 
     # Selección de camino
-    print("Llegas a una bifurcación en el camino.")
-    print("Un camino lleva al bosque tranquilo, el otro a una cueva oscura.")
-    print(" ")
-    print(Fore.YELLOW + "1. Ir por el bosque (Ruta Segura).")
-    print(Fore.YELLOW + "2. Entrar a la cueva (Ruta Peligrosa).")
-    decision_camino = int(input())
+    emitir(MENU_CAMINO)
+    decision_camino = leer_opcion("12")
 
     if decision_camino == 1:
-        print("Decides tomar el camino del bosque.")
-        print("Es un paseo agradable y llegas al pueblo sin incidentes.")
+        emitir("Decides tomar el camino del bosque.\n"
+               "Es un paseo agradable y llegas al pueblo sin incidentes.\n")
     elif decision_camino == 2:
-        print("Con valentía, entras en la cueva oscura...")
+        emitir("Con valentía, entras en la cueva oscura...\n")
 
         # Seleccionar monstruo al azar
-        nombre_monstruo = random.choice(list(catalogo_monstruos.keys()))
-        stats = catalogo_monstruos[nombre_monstruo]
-        monstruo = Personaje(nombre_monstruo, stats["vidas"], stats["ataque"])
+        i = random.randrange(len(NOMBRES_MONSTRUOS))
+        monstruo = Personaje(NOMBRES_MONSTRUOS[i], VIDAS_MONSTRUOS[i], ATAQUES_MONSTRUOS[i])
+
+        emitir(f"¡Un {monstruo.nombre} salvaje aparece!\n")
+        emitir(INICIO_COMBATE)
 
-        print(f"¡Un {monstruo.nombre} salvaje aparece!")
-        print(Fore.YELLOW + "¡COMIENZA EL COMBATE!")
+        # Textos del combate que no cambian entre turnos
+        prefijo_vida_jugador = f"Vida de {jugador.nombre}: "
+        prefijo_vida_monstruo = f"Vida del {monstruo.nombre}: "
+        menu_combate = MENU_COMBATE.format(ataque=jugador.ataque)
+        mensaje_ataque = (f"{VERDE}¡Atacas al {monstruo.nombre} con todas tus fuerzas!\n"
+                          f"Le infliges {jugador.ataque} de daño.\n{REINICIO}")
+        mensaje_contraataque = f"El {monstruo.nombre} contraataca...\n"
 
         # Bucle de combate
         while jugador.vidas > 0 and monstruo.vidas > 0:
-            print("--- NUEVO TURNO ---")
-            print(f"Vida de {jugador.nombre}: {jugador.vidas}")
-            print(f"Vida del {monstruo.nombre}: {monstruo.vidas}")
-            print(" ")
-            print(Fore.YELLOW + "¿Qué harás?")
-            print(Fore.YELLOW + f"1. Atacar ({jugador.ataque} de daño)")
-            print(Fore.YELLOW + "2. Defenderse (reduce el próximo golpe a la mitad)")
-            decision_combate = int(input())
+            emitir(ENCABEZADO_TURNO)
+            emitir(prefijo_vida_jugador + str(jugador.vidas) + "\n")
+            emitir(prefijo_vida_monstruo + str(monstruo.vidas) + "\n")
+            emitir(menu_combate)
+            decision_combate = leer_opcion("12")
 
             if decision_combate == 1:
-                jugador.atacar(monstruo)
+                emitir(mensaje_ataque)
             elif decision_combate == 2:
-                jugador.defender()
+                emitir(MENSAJE_DEFENSA)
             else:
-                print("Decisión inválida, turno perdido.")
-
-            # Turno del monstruo
-            if monstruo.vidas > 0:
-                print(f"El {monstruo.nombre} contraataca...")
-                if jugador.esta_defendiendo:
-                    dano = monstruo.ataque // 2
-                    print(Fore.BLUE + "¡Bloqueas la mayor parte del golpe!")
-                    print(Fore.RED + f"Recibes solo {dano} de daño.")
-                    jugador.vidas -= dano
-                    jugador.esta_defendiendo = False
+                emitir("Decisión inválida, turno perdido.\n")
+
+            # Turno del monstruo (None si el ataque del jugador lo derrotó)
+            dano = resolver_turno(jugador, monstruo, decision_combate)
+            if dano is not None:
+                emitir(mensaje_contraataque)
+                if decision_combate == 2:
+                    emitir(f"{AZUL}¡Bloqueas la mayor parte del golpe!\n"
+                           f"{ROJO}Recibes solo {dano} de daño.\n{REINICIO}")
                 else:
-                    print(Fore.RED + "¡Recibes el golpe directo!")
-                    print(Fore.RED + f"Pierdes {monstruo.ataque} de vida.")
-                    jugador.vidas -= monstruo.ataque
+                    emitir(f"{ROJO}¡Recibes el golpe directo!\n"
+                           f"Pierdes {dano} de vida.\n{REINICIO}")
 
         # Resultado del combate
         if jugador.vidas <= 0:
-            print(Fore.RED + f"Has sido derrotado por el {monstruo.nombre}... Fin del juego.")
+            emitir(f"{ROJO}Has sido derrotado por el {monstruo.nombre}... Fin del juego.{REINICIO}\n")
         else:
-            print(Fore.GREEN + f"¡VICTORIA! Has eliminado al {monstruo.nombre}.")
-            print(Fore.GREEN + "Encuentras un ¡Manual de Python!")
-            print(Fore.GREEN + "Tu aventura continúa...")
+            emitir(f"{VERDE}¡VICTORIA! Has eliminado al {monstruo.nombre}.\n"
+                   "Encuentras un ¡Manual de Python!\n"
+                   f"Tu aventura continúa...\n{REINICIO}")
     else:
-        print("Te quedaste paralizado por la indecisión y un conejo te robó.")
-        print("Fin del juego.")
+        emitir("Te quedaste paralizado por la indecisión y un conejo te robó.\n"
+               "Fin del juego.\n")
 
-    print("------------------------------------------------")
-    print(f"Fin de la demo. Gracias por jugar, {jugador.nombre}.")
+    emitir(SEPARADOR)
+    emitir(f"Fin de la demo. Gracias por jugar, {jugador.nombre}.\n")
+    volcar()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file